@@ -1,6 +1,10 @@
+import asyncio
 import logging
+import math
 import random
 import textwrap
+import threading
+from contextlib import contextmanager
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
@@ -18,9 +22,11 @@ from dspy.teleprompt.utils import (
     get_program_with_highest_avg_score,
     get_signature,
     print_full_program,
+    reduce_scores,
     save_candidate_program,
     set_signature,
 )
+from dspy.utils.asyncify import asyncify
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +34,7 @@ logger = logging.getLogger(__name__)
 BOOTSTRAPPED_FEWSHOT_EXAMPLES_IN_CONTEXT = 3
 LABELED_FEWSHOT_EXAMPLES_IN_CONTEXT = 0
 MIN_MINIBATCH_SIZE = 50
+MINIBATCH_EVAL_CHUNKS = 4
 
 AUTO_RUN_SETTINGS = {
     "light": {"num_trials": 7, "val_size": 100},
@@ -62,6 +69,7 @@ class MIPROv2(Teleprompter):
         track_stats: bool = True,
         log_dir: Optional[str] = None,
         metric_threshold: Optional[float] = None,
+        async_eval: bool = False,
     ):
         # Validate 'auto' parameter
         allowed_modes = {None, "light", "medium", "heavy"}
@@ -87,6 +95,7 @@ class MIPROv2(Teleprompter):
         self.num_threads = num_threads
         self.max_errors = max_errors
         self.metric_threshold = metric_threshold
+        self.async_eval = async_eval
         self.seed = seed
         self.rng = None
 
@@ -110,6 +119,11 @@ class MIPROv2(Teleprompter):
         tip_aware_proposer: bool = True,
         fewshot_aware_proposer: bool = True,
         requires_permission_to_run: bool = True,
+        storage: Optional[str] = None,
+        study_name: Optional[str] = None,
+        n_workers: int = 1,
+        n_jobs: int = 1,
+        cheap_lm: Optional[Any] = None,
     ) -> Any:
         # Set random seeds
         seed = seed or self.seed
@@ -165,40 +179,77 @@ class MIPROv2(Teleprompter):
             display_progress=True,
         )
 
-        # Step 1: Bootstrap few-shot examples
-        demo_candidates = self._bootstrap_fewshot_examples(program, trainset, seed, teacher)
+        with self._persistent_lm_connections():
+            # Step 1: Bootstrap few-shot examples
+            demo_candidates = self._bootstrap_fewshot_examples(program, trainset, seed, teacher)
 
-        # Step 2: Propose instruction candidates
-        instruction_candidates = self._propose_instructions(
-            program,
-            trainset,
-            demo_candidates,
-            view_data_batch_size,
-            program_aware_proposer,
-            data_aware_proposer,
-            tip_aware_proposer,
-            fewshot_aware_proposer,
-        )
+            # Step 2: Propose instruction candidates
+            instruction_candidates = self._propose_instructions(
+                program,
+                trainset,
+                demo_candidates,
+                view_data_batch_size,
+                program_aware_proposer,
+                data_aware_proposer,
+                tip_aware_proposer,
+                fewshot_aware_proposer,
+            )
 
-        # If zero-shot, discard demos
-        if zeroshot_opt:
-            demo_candidates = None
+            # Drop duplicate proposed instructions so Optuna doesn't spend trial
+            # budget treating them as distinct categorical values.
+            instruction_candidates = self._dedupe_instruction_candidates(
+                instruction_candidates
+            )
 
-        # Step 3: Find optimal prompt parameters
-        best_program = self._optimize_prompt_parameters(
-            program,
-            instruction_candidates,
-            demo_candidates,
-            evaluate,
-            valset,
-            num_trials,
-            minibatch,
-            minibatch_size,
-            minibatch_full_eval_steps,
-            seed,
-        )
+            # If zero-shot, discard demos
+            if zeroshot_opt:
+                demo_candidates = None
+
+            # Step 3: Find optimal prompt parameters
+            best_program = self._optimize_prompt_parameters(
+                program,
+                instruction_candidates,
+                demo_candidates,
+                evaluate,
+                valset,
+                num_trials,
+                minibatch,
+                minibatch_size,
+                minibatch_full_eval_steps,
+                seed,
+                storage=storage,
+                study_name=study_name,
+                n_workers=n_workers,
+                n_jobs=n_jobs,
+                cheap_lm=cheap_lm,
+            )
 
         return best_program
+
+    @contextmanager
+    def _persistent_lm_connections(self):
+        """Install a shared keep-alive httpx pool for litellm for the duration of a
+        compile, so the thousands of LM calls issued reuse TCP/TLS connections
+        instead of re-handshaking. A session the user already installed is left
+        untouched."""
+        import httpx
+        import litellm
+
+        if litellm.client_session is not None:
+            yield
+            return
+
+        limits = httpx.Limits(
+            max_connections=self.num_threads * 2,
+            max_keepalive_connections=self.num_threads * 2,
+        )
+        client = httpx.Client(limits=limits)
+        litellm.client_session = client
+        try:
+            yield
+        finally:
+            litellm.client_session = None
+            client.close()
     
     def _set_random_seeds(self,
         seed
@@ -464,6 +515,28 @@ class MIPROv2(Teleprompter):
 
         return instruction_candidates
 
+    @staticmethod
+    def _dedupe_instruction_candidates(
+        instruction_candidates: Dict[int, List[str]],
+    ) -> Dict[int, List[str]]:
+        """Remove duplicate instructions per predictor, keeping first occurrences
+        (so index 0 stays the predictor's original instruction). Candidates that
+        differ only in whitespace or case count as duplicates; the search space
+        shrinks from N to the number of genuinely distinct instructions."""
+        deduped = {}
+        for i, candidates in instruction_candidates.items():
+            seen = {}
+            for instruction in candidates:
+                key = " ".join(instruction.split()).casefold()
+                seen.setdefault(key, instruction)
+            deduped[i] = list(seen.values())
+            if len(deduped[i]) < len(candidates):
+                logger.info(
+                    f"Predictor {i}: dropped {len(candidates) - len(deduped[i])} duplicate "
+                    f"instruction candidate(s); {len(deduped[i])} remain."
+                )
+        return deduped
+
     def _optimize_prompt_parameters(
         self,
         program: Any,
@@ -476,7 +549,39 @@ class MIPROv2(Teleprompter):
         minibatch_size: int,
         minibatch_full_eval_steps: int,
         seed: int,
+        storage: Optional[str] = None,
+        study_name: Optional[str] = None,
+        n_workers: int = 1,
+        n_jobs: int = 1,
+        cheap_lm: Optional[Any] = None,
     ) -> Optional[Any]:
+        # Warm the (optionally numba-jitted) score reducer so the first trial
+        # doesn't pay the one-time compilation cost.
+        reduce_scores([0.0])
+
+        # Structure-of-arrays layout: stack each predictor's candidate pool into an
+        # object-dtype matrix once, so each trial's selections are array gathers
+        # rather than repeated dict/list lookups.
+        num_predictors = len(program.predictors())
+        instruction_matrix, instruction_counts = self._stack_candidates(
+            instruction_candidates, num_predictors
+        )
+        if demo_candidates:
+            demo_matrix, demo_counts = self._stack_candidates(demo_candidates, num_predictors)
+        else:
+            demo_matrix, demo_counts = None, None
+
+        # Cache the valset as an object array so each trial's minibatch is a single
+        # rng.choice + fancy-indexing gather instead of Python-level sampling.
+        valset_arr = np.empty(len(valset), dtype=object)
+        valset_arr[:] = valset
+        minibatch_rng = np.random.default_rng(seed)
+
+        # Specialize the per-trial selection logic once for this fixed predictor count.
+        select_and_insert_params = self._make_param_selector(
+            instruction_matrix, instruction_counts, demo_matrix, demo_counts
+        )
+
         logger.info("Evaluating the default program...\n")
         default_score = eval_candidate_program(len(valset), valset, program, evaluate, self.rng)
         logger.info(f"Default program score: {default_score}\n")
@@ -497,6 +602,19 @@ class MIPROv2(Teleprompter):
         score_data= [(best_score, program.deepcopy(), True)]
         param_score_dict = defaultdict(list)
         fully_evaled_param_combos = {}
+        # Memoized scores keyed by (param combo, batch identity). TPE frequently
+        # re-samples the same categorical combination; when it does, the score is
+        # returned without issuing any LM calls. Cross-process reuse comes for free
+        # from dspy's on-disk LM cache.
+        candidate_score_cache = {}
+        # Exponentially-weighted mean/variance of the gap between a candidate's
+        # minibatch mean and its observed full-valset score. Once enough gaps have
+        # been observed, a periodic full eval whose outcome is already statistically
+        # decided can be skipped in favor of an EMA-adjusted estimate.
+        full_eval_stats = {"ema": 0.0, "var": 0.0, "n": 0}
+        # Guards the shared optimization state above when trials run on several
+        # threads (n_jobs > 1); each trial's program copy is already thread-private.
+        state_lock = threading.Lock()
 
         # Define the objective function
         def objective(trial):
@@ -514,13 +632,8 @@ class MIPROv2(Teleprompter):
             candidate_program = program.deepcopy()
 
             # Choose instructions and demos, insert them into the program
-            chosen_params = self._select_and_insert_instructions_and_demos(
-                candidate_program,
-                instruction_candidates,
-                demo_candidates,
-                trial,
-                trial_logs,
-                trial_num,
+            chosen_params = select_and_insert_params(
+                trial, candidate_program, trial_logs, trial_num
             )
 
             # Log assembled program
@@ -528,61 +641,107 @@ class MIPROv2(Teleprompter):
                 logger.info("Evaluating the following candidate program...\n")
                 print_full_program(candidate_program)
 
+            categorical_key = ",".join(map(str, chosen_params))
+
             # Evaluate the candidate program (on minibatch if minibatch=True)
             batch_size = minibatch_size if minibatch else len(valset)
-            score = eval_candidate_program(
-                batch_size, valset, candidate_program, evaluate, self.rng
-            )
-            total_eval_calls += batch_size
-
-            # Update best score and program
-            if not minibatch and score > best_score:
-                best_score = score
-                best_program = candidate_program.deepcopy()
-                logger.info(f"{GREEN}Best full score so far!{ENDC} Score: {score}")
-
-            # Log evaluation results
-            score_data.append((score, candidate_program, batch_size >= len(valset))) # score, prog, full_eval
+            pruned = False
+            eval_calls = 0
             if minibatch:
-                self._log_minibatch_eval(
-                    score,
-                    best_score,
-                    batch_size,
-                    chosen_params,
-                    score_data,
+                with state_lock:
+                    # np.random.Generator is not thread-safe; draw under the lock.
+                    sampled_idxs = minibatch_rng.choice(
+                        len(valset_arr), min(batch_size, len(valset_arr)), replace=False
+                    )
+                minibatch_examples = list(valset_arr[sampled_idxs])
+                score, eval_calls, pruned = self._eval_minibatch_with_pruning(
                     trial,
-                    num_trials,
-                    trial_logs,
-                    trial_num,
                     candidate_program,
-                    total_eval_calls,
+                    minibatch_examples,
+                    evaluate,
+                    categorical_key,
+                    candidate_score_cache,
+                    cheap_lm=cheap_lm,
                 )
+                if score is None:
+                    # Pruned on the cheap-LM probe: the trial has no task-model
+                    # score, so it must not enter score_data or param_score_dict,
+                    # which drive full-eval candidate selection.
+                    with state_lock:
+                        total_eval_calls += eval_calls
+                    trial_logs[trial_num]["pruned"] = True
+                    raise optuna.TrialPruned()
             else:
-                self._log_normal_eval(
-                    score, best_score, chosen_params, score_data, trial, num_trials, trial_logs, trial_num, valset, batch_size, candidate_program, total_eval_calls
+                cache_key = (categorical_key, len(valset))
+                if cache_key in candidate_score_cache:
+                    score = candidate_score_cache[cache_key]
+                    logger.info(f"Reusing cached score {score} for repeated parameters.")
+                else:
+                    score = eval_candidate_program(
+                        batch_size, valset, candidate_program, evaluate, self.rng
+                    )
+                    candidate_score_cache[cache_key] = score
+                    eval_calls = batch_size
+
+            # Bookkeeping mutates state shared by all concurrently running trials.
+            with state_lock:
+                total_eval_calls += eval_calls
+
+                # Update best score and program
+                if not minibatch and score > best_score:
+                    best_score = score
+                    best_program = candidate_program.deepcopy()
+                    logger.info(f"{GREEN}Best full score so far!{ENDC} Score: {score}")
+
+                # Log evaluation results
+                score_data.append((score, candidate_program, batch_size >= len(valset))) # score, prog, full_eval
+                if minibatch:
+                    self._log_minibatch_eval(
+                        score,
+                        best_score,
+                        batch_size,
+                        chosen_params,
+                        score_data,
+                        trial,
+                        num_trials,
+                        trial_logs,
+                        trial_num,
+                        candidate_program,
+                        total_eval_calls,
+                    )
+                else:
+                    self._log_normal_eval(
+                        score, best_score, chosen_params, score_data, trial, num_trials, trial_logs, trial_num, valset, batch_size, candidate_program, total_eval_calls
+                    )
+                param_score_dict[categorical_key].append(
+                    (score, candidate_program),
                 )
-            categorical_key = ",".join(map(str, chosen_params))
-            param_score_dict[categorical_key].append(
-                (score, candidate_program),
-            )
 
-            # If minibatch, perform full evaluation at intervals
-            if minibatch and (
-                (trial_num % minibatch_full_eval_steps == 0)
-                or (trial_num == num_trials)
-            ):
-                best_score, best_program, total_eval_calls = self._perform_full_evaluation(
-                    trial_num,
-                    param_score_dict,
-                    fully_evaled_param_combos,
-                    evaluate,
-                    valset,
-                    trial_logs,
-                    total_eval_calls,
-                    score_data,
-                    best_score,
-                    best_program,
-                )
+                # If minibatch, perform full evaluation at intervals
+                if minibatch and (
+                    (trial_num % minibatch_full_eval_steps == 0)
+                    or (trial_num == num_trials)
+                ):
+                    best_score, best_program, total_eval_calls = self._perform_full_evaluation(
+                        trial_num,
+                        param_score_dict,
+                        fully_evaled_param_combos,
+                        evaluate,
+                        valset,
+                        trial_logs,
+                        total_eval_calls,
+                        score_data,
+                        best_score,
+                        best_program,
+                        candidate_score_cache,
+                        full_eval_stats,
+                        # The final full eval is always measured, never estimated.
+                        allow_skip=trial_num != num_trials,
+                    )
+
+            if pruned:
+                trial_logs[trial_num]["pruned"] = True
+                raise optuna.TrialPruned()
 
             return score
 
@@ -593,9 +752,66 @@ class MIPROv2(Teleprompter):
             "We will evaluate the program over a series of trials with different combinations of instructions and few-shot examples to find the optimal combination using Bayesian Optimization.\n"
         )
 
-        sampler = optuna.samplers.TPESampler(seed=seed, multivariate=True)
-        study = optuna.create_study(direction="maximize", sampler=sampler)
-        study.optimize(objective, n_trials=num_trials)
+        # When the categorical space is small enough to enumerate within the trial
+        # budget, sweep it exhaustively with a GridSampler rather than letting TPE
+        # re-draw duplicate combinations.
+        search_space = {}
+        for i in range(len(program.predictors())):
+            if demo_candidates:
+                search_space[f"{i}_predictor_demos"] = list(range(len(demo_candidates[i])))
+            search_space[f"{i}_predictor_instruction"] = list(
+                range(len(instruction_candidates[i]))
+            )
+        search_space_size = math.prod(len(choices) for choices in search_space.values())
+        if search_space_size <= num_trials:
+            logger.info(
+                f"Search space has {search_space_size} combinations <= {num_trials} trials; using exhaustive grid search."
+            )
+            sampler = optuna.samplers.GridSampler(search_space, seed=seed)
+        else:
+            sampler = optuna.samplers.TPESampler(seed=seed, multivariate=True)
+        study_kwargs = {"direction": "maximize", "sampler": sampler}
+        if minibatch:
+            if cheap_lm is not None:
+                # Bracketed evaluation: the first chunk is probed with the cheap LM
+                # and Hyperband decides which candidates earn full-LM chunks.
+                study_kwargs["pruner"] = optuna.pruners.HyperbandPruner(
+                    min_resource=1, max_resource=MINIBATCH_EVAL_CHUNKS, reduction_factor=3
+                )
+            else:
+                # ASHA-style pruning: minibatch evals report a running mean per chunk,
+                # so clearly-bad candidates are cut after a chunk or two instead of
+                # spending the full minibatch budget.
+                study_kwargs["pruner"] = optuna.pruners.SuccessiveHalvingPruner(
+                    min_resource=1, reduction_factor=3
+                )
+        if storage is not None:
+            # Persistent (RDB) storage lets several worker processes share one study:
+            # launch N processes with the same `storage` URL (e.g. "sqlite:///mipro.db"
+            # or a postgres URL) and `study_name`, and each will pull trials from it.
+            study_kwargs.update(
+                storage=storage,
+                study_name=study_name or f"mipro_seed_{seed}",
+                load_if_exists=True,
+            )
+        study = optuna.create_study(**study_kwargs)
+
+        # Each worker runs its share of the trials; the MaxTrialsCallback enforces the
+        # global `num_trials` budget across all workers attached to the study.
+        worker_trials = max(1, num_trials // max(1, n_workers))
+        # n_jobs > 1 runs that share on a thread pool within this process; trials
+        # mostly wait on LM calls, so threads overlap well, and they reuse the
+        # keep-alive connection pool installed by _persistent_lm_connections.
+        study.optimize(
+            objective,
+            n_trials=worker_trials,
+            n_jobs=n_jobs,
+            callbacks=[
+                optuna.study.MaxTrialsCallback(
+                    num_trials, states=(optuna.trial.TrialState.COMPLETE,)
+                )
+            ],
+        )
 
         # Attach logs to best program
         if best_program is not None and self.track_stats:
@@ -613,6 +829,113 @@ class MIPROv2(Teleprompter):
 
         return best_program
 
+    def _eval_minibatch_with_pruning(
+        self,
+        trial: optuna.trial.Trial,
+        candidate_program: Any,
+        minibatch_examples: List,
+        evaluate: Evaluate,
+        categorical_key: Optional[str] = None,
+        candidate_score_cache: Optional[Dict] = None,
+        cheap_lm: Optional[Any] = None,
+    ) -> Tuple[Optional[float], int, bool]:
+        """Evaluate a candidate on a minibatch in chunks, reporting the running mean
+        to Optuna after each chunk so unpromising candidates can be pruned early.
+
+        When `cheap_lm` is given, the first chunk is run with it as the default LM
+        (a low-cost probe that only informs pruning); surviving candidates spend the
+        remaining chunks on the real task model, and only those scores count toward
+        the returned mean. Predictors with an explicitly pinned lm ignore the probe
+        override.
+
+        Returns the (possibly partial) mean score, the number of examples actually
+        evaluated (cached chunks count as free), and whether the trial was pruned.
+        Trials pruned on the probe itself return None as the score, since no
+        task-model score exists for them."""
+        chunk_size = max(1, math.ceil(len(minibatch_examples) / MINIBATCH_EVAL_CHUNKS))
+        chunk_scores = []
+        chunk_sizes = []
+        num_scored = 0
+        num_evaluated = 0
+        running_mean = 0.0
+
+        for step, start_idx in enumerate(range(0, len(minibatch_examples), chunk_size)):
+            chunk = minibatch_examples[start_idx : start_idx + chunk_size]
+            probe = cheap_lm is not None and step == 0
+            cache_key = None
+            if candidate_score_cache is not None:
+                cache_key = (categorical_key, tuple(map(id, chunk)), probe)
+            if cache_key is not None and cache_key in candidate_score_cache:
+                chunk_score = candidate_score_cache[cache_key]
+            else:
+                if probe:
+                    with dspy.settings.context(lm=cheap_lm):
+                        chunk_score = eval_candidate_program(
+                            len(chunk), chunk, candidate_program, evaluate, self.rng
+                        )
+                elif self.async_eval:
+                    chunk_score = self._eval_candidate_async(candidate_program, chunk)
+                else:
+                    chunk_score = eval_candidate_program(
+                        len(chunk), chunk, candidate_program, evaluate, self.rng
+                    )
+                if cache_key is not None:
+                    candidate_score_cache[cache_key] = chunk_score
+                num_evaluated += len(chunk)
+
+            if probe:
+                # The probe informs the pruner but is excluded from the candidate's
+                # score, which should reflect the real task model only. A trial
+                # pruned here has no task-model score at all, hence the None.
+                trial.report(chunk_score, step)
+                if trial.should_prune():
+                    logger.info(
+                        f"Pruned trial on the cheap-LM probe (probe score: {chunk_score})."
+                    )
+                    return None, num_evaluated, True
+                continue
+
+            chunk_scores.append(chunk_score)
+            chunk_sizes.append(len(chunk))
+            num_scored += len(chunk)
+            running_mean = reduce_scores(chunk_scores, chunk_sizes)
+
+            trial.report(running_mean, step)
+            if trial.should_prune():
+                logger.info(
+                    f"Pruned trial after {num_scored} / {len(minibatch_examples)} minibatch examples."
+                )
+                return running_mean, num_evaluated, True
+
+        return running_mean, num_evaluated, False
+
+    def _eval_candidate_async(self, candidate_program: Any, batch: List) -> float:
+        """Score a candidate program on a batch with all examples in flight at once.
+
+        Each example is run through `asyncify`, so LM calls overlap while waiting on
+        the network; a semaphore bounds in-flight calls at `self.num_threads`. Errors
+        on individual examples score 0, matching `eval_candidate_program`."""
+        aprogram = asyncify(candidate_program)
+
+        async def run_batch():
+            semaphore = asyncio.Semaphore(self.num_threads)
+
+            async def run_one(example):
+                async with semaphore:
+                    try:
+                        prediction = await aprogram(**example.inputs())
+                        return float(self.metric(example, prediction))
+                    except Exception as e:
+                        logger.warning(f"Exception during async evaluation: {e}")
+                        return 0.0
+
+            return await asyncio.gather(*[run_one(example) for example in batch])
+
+        scores = asyncio.run(run_batch())
+        if not scores:
+            return 0.0
+        return round(100 * sum(scores) / len(scores), 2)
+
     def _log_minibatch_eval(
         self,
         score,
@@ -632,7 +955,9 @@ class MIPROv2(Teleprompter):
         )
         trial_logs[trial_num]["mb_score"] = score
         trial_logs[trial_num]["total_eval_calls_so_far"] = total_eval_calls
-        trial_logs[trial_num]["mb_program"] = candidate_program.deepcopy()
+        # Each trial gets its own program copy that is never mutated afterwards, so
+        # logging the reference avoids another deepcopy per trial.
+        trial_logs[trial_num]["mb_program"] = candidate_program
 
         logger.info(
             f"Score: {score} on minibatch of size {batch_size} with parameters {chosen_params}."
@@ -653,47 +978,90 @@ class MIPROv2(Teleprompter):
         )
         trial_logs[trial_num]["full_eval_score"] = score
         trial_logs[trial_num]["total_eval_calls_so_far"] = total_eval_calls
-        trial_logs[trial_num]["full_eval_program"] = candidate_program.deepcopy()
+        trial_logs[trial_num]["full_eval_program"] = candidate_program
 
         logger.info(f"Score: {score} with parameters {chosen_params}.")
         logger.info(f"Scores so far: {'['+', '.join([f'{s[0]}' for s in score_data if s[2]])+']'}")
         logger.info(f"Best score so far: {best_score}")
         logger.info(f'{"="*len(f"===== Trial {trial.number+1} / {num_trials} =====")}\n\n')
 
-    def _select_and_insert_instructions_and_demos(
+    @staticmethod
+    def _stack_candidates(candidates: Dict[int, List], num_predictors: int) -> Tuple[np.ndarray, List[int]]:
+        """Stack per-predictor candidate lists into an object-dtype (num_predictors,
+        max_candidates) matrix, plus the true per-predictor candidate counts."""
+        counts = [len(candidates[i]) for i in range(num_predictors)]
+        matrix = np.empty((num_predictors, max(counts)), dtype=object)
+        for i in range(num_predictors):
+            for j, candidate in enumerate(candidates[i]):
+                matrix[i, j] = candidate
+        return matrix, counts
+
+    def _make_param_selector(
         self,
-        candidate_program: Any,
-        instruction_candidates: Dict[int, List[str]],
-        demo_candidates: Optional[List],
-        trial: optuna.trial.Trial,
-        trial_logs: Dict,
-        trial_num: int,
-    ) -> List[str]:
-        chosen_params = []
-
-        for i, predictor in enumerate(candidate_program.predictors()):
-            # Select instruction
-            instruction_idx = trial.suggest_categorical(
-                f"{i}_predictor_instruction", range(len(instruction_candidates[i]))
-            )
-            selected_instruction = instruction_candidates[i][instruction_idx]
-            updated_signature = get_signature(predictor).with_instructions(
-                selected_instruction
-            )
-            set_signature(predictor, updated_signature)
-            trial_logs[trial_num][f"{i}_predictor_instruction"] = instruction_idx
-            chosen_params.append(f"Predictor {i}: Instruction {instruction_idx}")
-
-            # Select demos if available
-            if demo_candidates:
-                demos_idx = trial.suggest_categorical(
-                    f"{i}_predictor_demos", range(len(demo_candidates[i]))
-                )
-                predictor.demos = demo_candidates[i][demos_idx]
-                trial_logs[trial_num][f"{i}_predictor_demos"] = demos_idx
-                chosen_params.append(f"Predictor {i}: Few-Shot Set {demos_idx}")
-
-        return chosen_params
+        instruction_matrix: np.ndarray,
+        instruction_counts: List[int],
+        demo_matrix: Optional[np.ndarray],
+        demo_counts: Optional[List[int]],
+    ) -> Callable:
+        """Partially evaluate per-trial parameter selection against the fixed
+        predictor count: Optuna parameter names, candidate ranges, and index arrays
+        are computed once here instead of being rebuilt inside every trial."""
+        num_predictors = len(instruction_counts)
+        rows = np.arange(num_predictors)
+        instruction_params = [
+            (f"{i}_predictor_instruction", range(n)) for i, n in enumerate(instruction_counts)
+        ]
+        demo_params = None
+        if demo_counts is not None:
+            demo_params = [(f"{i}_predictor_demos", range(n)) for i, n in enumerate(demo_counts)]
+
+        # with_instructions builds a fresh Signature class on every call; memoize the
+        # result per (predictor, instruction index) so trials that revisit an
+        # instruction share one immutable signature object instead of rebuilding it.
+        signature_cache: Dict[Tuple[int, int], Any] = {}
+
+        def select_and_insert(trial, candidate_program, trial_logs, trial_num):
+            predictors = candidate_program.predictors()
+
+            # Suggest all indices, then gather the chosen candidates in one indexing
+            # op per matrix. Demos are suggested before instructions so the signature
+            # (which renders as the prompt prefix) is only touched once below.
+            demo_idxs = None
+            if demo_params is not None:
+                demo_idxs = [trial.suggest_categorical(name, choices) for name, choices in demo_params]
+                chosen_demos = demo_matrix[rows, demo_idxs]
+            instruction_idxs = [
+                trial.suggest_categorical(name, choices) for name, choices in instruction_params
+            ]
+            chosen_instructions = instruction_matrix[rows, instruction_idxs]
+
+            chosen_params = []
+            for i, predictor in enumerate(predictors):
+                if demo_idxs is not None:
+                    predictor.demos = chosen_demos[i]
+                    trial_logs[trial_num][demo_params[i][0]] = demo_idxs[i]
+
+                selected_instruction = chosen_instructions[i]
+                # Only rewrite the signature when the instruction actually changes:
+                # trials that revisit the current instruction then keep a byte-identical
+                # prompt prefix, which preserves provider-side prompt-cache hits.
+                if selected_instruction != get_signature(predictor).instructions:
+                    sig_key = (i, instruction_idxs[i])
+                    updated_signature = signature_cache.get(sig_key)
+                    if updated_signature is None:
+                        updated_signature = get_signature(predictor).with_instructions(
+                            selected_instruction
+                        )
+                        signature_cache[sig_key] = updated_signature
+                    set_signature(predictor, updated_signature)
+                trial_logs[trial_num][instruction_params[i][0]] = instruction_idxs[i]
+                chosen_params.append(f"Predictor {i}: Instruction {instruction_idxs[i]}")
+                if demo_idxs is not None:
+                    chosen_params.append(f"Predictor {i}: Few-Shot Set {demo_idxs[i]}")
+
+            return chosen_params
+
+        return select_and_insert
 
     def _perform_full_evaluation(
         self,
@@ -707,6 +1075,9 @@ class MIPROv2(Teleprompter):
         score_data,
         best_score: float,
         best_program: Any,
+        candidate_score_cache: Optional[Dict] = None,
+        full_eval_stats: Optional[Dict] = None,
+        allow_skip: bool = False,
     ):
         logger.info(f"===== Full Eval {len(fully_evaled_param_combos)+1} =====")
 
@@ -716,20 +1087,82 @@ class MIPROv2(Teleprompter):
                 param_score_dict, fully_evaled_param_combos
             )
         )
+
+        # Skip the full eval when the leader's minibatch margin over the runner-up
+        # already exceeds what minibatch-vs-full noise can explain; the full eval
+        # would only confirm the trend, so spend an EMA-adjusted estimate instead
+        # of len(valset) LM calls. The estimate is clearly flagged in the logs.
+        if allow_skip and full_eval_stats is not None and full_eval_stats["n"] >= 2:
+            runner_up_means = [
+                np.mean([s for s, _ in scores])
+                for key, scores in param_score_dict.items()
+                if key != combo_key and key not in fully_evaled_param_combos
+            ]
+            if runner_up_means:
+                margin = mean_score - max(runner_up_means)
+                std_err = math.sqrt(full_eval_stats["var"] / full_eval_stats["n"])
+                # A degenerate variance estimate (identical gaps so far, common with
+                # coarse rounded metrics) or a non-positive margin is never treated
+                # as decisive; fall through to a measured full eval instead.
+                if margin > 0 and std_err > 0 and margin / std_err > 2.5:
+                    z = margin / std_err
+                    estimated_score = round(mean_score - full_eval_stats["ema"], 2)
+                    logger.info(
+                        f"Skipping full eval: minibatch margin {margin:.2f} over the "
+                        f"runner-up is decisive (z={z:.2f} > 2.5). Using EMA-adjusted "
+                        f"estimate {estimated_score} instead."
+                    )
+                    fully_evaled_param_combos[combo_key] = {
+                        "program": highest_mean_program,
+                        "score": estimated_score,
+                        "estimated": True,
+                    }
+                    trial_logs[trial_num]["full_eval_skipped"] = True
+                    trial_logs[trial_num]["full_eval_score_estimate"] = estimated_score
+                    trial_logs[trial_num]["total_eval_calls_so_far"] = total_eval_calls
+                    if estimated_score > best_score:
+                        logger.info(
+                            f"{GREEN}New best (estimated) full eval score!{ENDC} Score: {estimated_score}"
+                        )
+                        best_score = estimated_score
+                        best_program = highest_mean_program.deepcopy()
+                    return best_score, best_program, total_eval_calls
+
         logger.info(
             f"Doing full eval on next top averaging program (Avg Score: {mean_score}) from minibatch trials..."
         )
-        full_eval_score = eval_candidate_program(
-            len(valset), valset, highest_mean_program, evaluate, self.rng
-        )
+        cache_key = (combo_key, len(valset))
+        if candidate_score_cache is not None and cache_key in candidate_score_cache:
+            full_eval_score = candidate_score_cache[cache_key]
+            logger.info(f"Reusing cached full eval score {full_eval_score}.")
+        else:
+            full_eval_score = eval_candidate_program(
+                len(valset), valset, highest_mean_program, evaluate, self.rng
+            )
+            if candidate_score_cache is not None:
+                candidate_score_cache[cache_key] = full_eval_score
+            total_eval_calls += len(valset)
         score_data.append((full_eval_score, highest_mean_program, True))
 
+        if full_eval_stats is not None:
+            # Fold the observed minibatch-vs-full gap into the running EMA/variance.
+            delta = mean_score - full_eval_score
+            if full_eval_stats["n"] == 0:
+                full_eval_stats["ema"] = delta
+            else:
+                alpha = 0.3
+                diff = delta - full_eval_stats["ema"]
+                full_eval_stats["ema"] += alpha * diff
+                full_eval_stats["var"] = (1 - alpha) * (
+                    full_eval_stats["var"] + alpha * diff * diff
+                )
+            full_eval_stats["n"] += 1
+
         # Log full evaluation results
         fully_evaled_param_combos[combo_key] = {
             "program": highest_mean_program,
             "score": full_eval_score,
         }
-        total_eval_calls += len(valset)
         trial_logs[trial_num]["total_eval_calls_so_far"] = total_eval_calls
         trial_logs[trial_num]["full_eval_program_path"] = save_candidate_program(
             program=highest_mean_program,
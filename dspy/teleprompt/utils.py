@@ -14,6 +14,15 @@ except ImportError:
     # Won't be able to read code from juptyer notebooks
     extract_symbols = None
 
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Score reductions fall back to plain NumPy
+    njit = None
+    _NUMBA_AVAILABLE = False
+
 import dspy
 from dspy.teleprompt.bootstrap import BootstrapFewShot, LabeledFewShot
 
@@ -105,19 +114,46 @@ def eval_candidate_program_with_pruning(
     return score, trial_logs, total_eval_size, False
 
 
+def _reduce_scores_impl(scores, weights):
+    total_weight = 0.0
+    total = 0.0
+    for i in range(scores.shape[0]):
+        total += scores[i] * weights[i]
+        total_weight += weights[i]
+    if total_weight == 0.0:
+        return 0.0
+    return total / total_weight
+
+
+if _NUMBA_AVAILABLE:
+    _reduce_scores_impl = njit(cache=True, fastmath=True)(_reduce_scores_impl)
+
+
+def reduce_scores(scores, weights=None):
+    """Weighted mean over per-batch scores. JIT-compiled via numba when available,
+    plain NumPy otherwise. Call once with dummy data to warm the JIT before timing-
+    sensitive loops."""
+    scores = np.asarray(scores, dtype=np.float64)
+    if weights is None:
+        weights = np.ones_like(scores)
+    else:
+        weights = np.asarray(weights, dtype=np.float64)
+    return float(_reduce_scores_impl(scores, weights))
+
+
 def get_program_with_highest_avg_score(param_score_dict, fully_evaled_param_combos):
     """Used as a helper function for bayesian + minibatching optimizers. Returns the program with the highest average score from the batches evaluated so far."""
 
     # Calculate the mean for each combination of categorical parameters, based on past trials
     results = []
     for key, values in param_score_dict.items():
-        scores = np.array([v[0] for v in values])
-        mean = np.average(scores)
+        mean = reduce_scores([v[0] for v in values])
         program = values[0][1]
         results.append((key, mean, program))
 
     # Sort results by the mean
-    sorted_results = sorted(results, key=lambda x: x[1], reverse=True)
+    order = np.argsort(-np.array([mean for _, mean, _ in results]), kind="stable")
+    sorted_results = [results[i] for i in order]
 
     # Find the combination with the highest mean, skip fully evaluated ones
     for combination in sorted_results:
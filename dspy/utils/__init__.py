@@ -1,5 +1,6 @@
 from dspy.utils.callback import BaseCallback, with_callbacks
 from dspy.utils.dummies import DummyLM, DummyVectorizer, dummy_rm
+from dspy.utils.langfuse_callback import LangfuseCallback
 
 import os
 import requests
@@ -20,6 +21,7 @@ def download(url):
 __all__ = [
     "download",
     "BaseCallback",
+    "LangfuseCallback",
     "with_callbacks",
     "DummyLM",
     "DummyVectorizer",
@@ -0,0 +1,186 @@
+import logging
+import queue
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from dspy.utils.callback import BaseCallback
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling the background flush thread to drain and exit.
+_SHUTDOWN = object()
+
+# Upper bound on in-flight call records. with_callbacks always fires end handlers,
+# but if one is ever skipped (e.g. a crashed worker thread) the stale record would
+# otherwise live for the whole process; evicting the oldest entries keeps memory
+# bounded on long optimization runs.
+MAX_IN_FLIGHT_CALLS = 10_000
+
+# The innermost open trace/span/generation for the current logical call stack.
+# Start handlers push the new node and stash the reset token; end handlers pop via
+# that token. Parenting therefore costs one ContextVar set/reset per call instead
+# of per-call dict lookups against process-wide trace/observation tables.
+_CURRENT_NODE: ContextVar[Optional[Any]] = ContextVar("langfuse_current_node", default=None)
+
+
+class LangfuseCallback(BaseCallback):
+    """A callback that reports dspy execution traces to Langfuse.
+
+    Top-level module calls open a Langfuse trace; nested module and tool calls open
+    spans under their parent, and LM calls open generations. Requires the `langfuse`
+    package (`pip install langfuse`); credentials are read from the standard
+    `LANGFUSE_*` environment variables unless a configured client is passed in.
+
+    Example:
+
+    ```
+    import dspy
+    from dspy.utils.langfuse_callback import LangfuseCallback
+
+    dspy.settings.configure(callbacks=[LangfuseCallback()])
+
+    cot = dspy.ChainOfThought("question -> answer")
+    cot(question="What is the meaning of life?")
+    ```
+    """
+
+    def __init__(
+        self,
+        langfuse: Optional[Any] = None,
+        background: bool = True,
+        flush_batch_size: int = 32,
+        flush_interval: float = 1.0,
+        **langfuse_kwargs,
+    ):
+        if langfuse is None:
+            try:
+                from langfuse import Langfuse
+            except ImportError:
+                raise ImportError(
+                    "LangfuseCallback requires the langfuse package. Install it with `pip install langfuse`."
+                )
+            langfuse = Langfuse(**langfuse_kwargs)
+        self.langfuse = langfuse
+
+        # One small record per in-flight call: call_id -> (node, contextvar token).
+        self._calls: Dict[str, Any] = {}
+
+        # Finished nodes are closed (and the client flushed) on a background thread
+        # so end handlers stay O(1) on the caller's critical path. Flushes happen
+        # every `flush_batch_size` events, or after `flush_interval` seconds of idleness.
+        self._background = background
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval = flush_interval
+        self._queue: Optional[queue.Queue] = None
+        self._flush_thread: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue()
+            self._flush_thread = threading.Thread(target=self._drain_queue, daemon=True)
+            self._flush_thread.start()
+
+    def on_module_start(self, call_id: str, instance: Any, inputs: Dict[str, Any]):
+        name = instance.__class__.__name__
+        parent = _CURRENT_NODE.get()
+        if parent is None:
+            node = self.langfuse.trace(name=name, input=inputs)
+        else:
+            node = parent.span(name=name, input=inputs)
+        self._track_call(call_id, node)
+
+    def on_module_end(self, call_id: str, outputs: Optional[Any], exception: Optional[Exception] = None):
+        self._end_call(call_id, outputs, exception)
+
+    def on_lm_start(self, call_id: str, instance: Any, inputs: Dict[str, Any]):
+        parent = _CURRENT_NODE.get() or self.langfuse
+        node = parent.generation(
+            name=instance.__class__.__name__,
+            input=inputs,
+            model=getattr(instance, "model", None),
+        )
+        self._track_call(call_id, node)
+
+    def on_lm_end(self, call_id: str, outputs: Optional[Any], exception: Optional[Exception] = None):
+        self._end_call(call_id, outputs, exception)
+
+    def on_tool_start(self, call_id: str, instance: Any, inputs: Dict[str, Any]):
+        parent = _CURRENT_NODE.get() or self.langfuse
+        node = parent.span(name=getattr(instance, "name", instance.__class__.__name__), input=inputs)
+        self._track_call(call_id, node)
+
+    def on_tool_end(self, call_id: str, outputs: Optional[Any], exception: Optional[Exception] = None):
+        self._end_call(call_id, outputs, exception)
+
+    def _track_call(self, call_id: str, node: Any):
+        if len(self._calls) >= MAX_IN_FLIGHT_CALLS:
+            # Dicts preserve insertion order, so the first key is the oldest record.
+            stale_id = next(iter(self._calls))
+            self._calls.pop(stale_id, None)
+            logger.warning(
+                "Evicted a stale Langfuse call record; an end handler was likely never invoked."
+            )
+        self._calls[call_id] = (node, _CURRENT_NODE.set(node))
+
+    def _end_call(self, call_id: str, outputs: Optional[Any], exception: Optional[Exception]):
+        record = self._calls.pop(call_id, None)
+        if record is None:
+            return
+        node, token = record
+        _CURRENT_NODE.reset(token)
+        if self._queue is not None:
+            self._queue.put((node, outputs, exception))
+        else:
+            self._finish_node(node, outputs, exception)
+
+    def _finish_node(self, node: Any, outputs: Optional[Any], exception: Optional[Exception]):
+        kwargs = {"output": outputs}
+        if exception is not None:
+            kwargs.update(level="ERROR", status_message=str(exception))
+        # Spans and generations are closed with end(); traces only support update().
+        if hasattr(node, "end"):
+            node.end(**kwargs)
+        else:
+            node.update(**kwargs)
+
+    def _drain_queue(self):
+        pending = 0
+        while True:
+            try:
+                item = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                if pending:
+                    self._flush_client()
+                    pending = 0
+                continue
+
+            if item is _SHUTDOWN:
+                break
+
+            try:
+                self._finish_node(*item)
+            except Exception as e:
+                logger.warning(f"Error finishing Langfuse observation: {e}")
+            pending += 1
+            if pending >= self._flush_batch_size:
+                self._flush_client()
+                pending = 0
+
+        if pending:
+            self._flush_client()
+
+    def _flush_client(self):
+        try:
+            flush = getattr(self.langfuse, "flush", None)
+            if flush is not None:
+                flush()
+        except Exception as e:
+            logger.warning(f"Error flushing Langfuse client: {e}")
+
+    def shutdown(self):
+        """Drain any queued observations and stop the background flush thread."""
+        if self._flush_thread is None:
+            return
+        self._queue.put(_SHUTDOWN)
+        self._flush_thread.join()
+        self._flush_thread = None
+        self._queue = None
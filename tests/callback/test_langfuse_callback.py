@@ -0,0 +1,128 @@
+import pytest
+
+import dspy
+from dspy.utils.dummies import DummyLM
+from dspy.utils.langfuse_callback import _CURRENT_NODE, LangfuseCallback
+
+
+@pytest.fixture(autouse=True)
+def reset_settings():
+    # Make sure the settings are reset after each test
+    original_settings = dspy.settings.copy()
+
+    yield
+
+    dspy.settings.configure(**original_settings)
+
+
+class FakeNode:
+    """Stands in for Langfuse traces, spans, and generations."""
+
+    def __init__(self, client, kind, name):
+        self.client = client
+        self.kind = kind
+        self.name = name
+        self.ended = False
+        self.end_kwargs = None
+
+    def span(self, name=None, **kwargs):
+        return self.client._record("span", name)
+
+    def generation(self, name=None, **kwargs):
+        return self.client._record("generation", name)
+
+    def end(self, **kwargs):
+        self.ended = True
+        self.end_kwargs = kwargs
+
+    def update(self, **kwargs):
+        self.ended = True
+        self.end_kwargs = kwargs
+
+
+class FakeLangfuse:
+    def __init__(self):
+        self.nodes = []
+        self.flush_count = 0
+
+    def flush(self):
+        self.flush_count += 1
+
+    def _record(self, kind, name):
+        node = FakeNode(self, kind, name)
+        self.nodes.append(node)
+        return node
+
+    def trace(self, name=None, **kwargs):
+        return self._record("trace", name)
+
+    def span(self, name=None, **kwargs):
+        return self._record("span", name)
+
+    def generation(self, name=None, **kwargs):
+        return self._record("generation", name)
+
+
+def test_langfuse_callback_records_nested_calls():
+    fake = FakeLangfuse()
+    callback = LangfuseCallback(langfuse=fake, background=False)
+    dspy.settings.configure(lm=DummyLM([{"answer": "42"}]), callbacks=[callback])
+
+    predict = dspy.Predict("question -> answer")
+    predict(question="What is the meaning of life?")
+
+    kinds = [node.kind for node in fake.nodes]
+    assert kinds[0] == "trace"  # The top-level module call opens a trace.
+    assert "generation" in kinds  # The LM call opens a generation under it.
+    assert all(node.ended for node in fake.nodes)
+    assert not callback._calls  # No in-flight call records should remain.
+    assert _CURRENT_NODE.get() is None
+
+
+def test_langfuse_callback_records_exceptions():
+    fake = FakeLangfuse()
+    callback = LangfuseCallback(langfuse=fake, background=False)
+    dspy.settings.configure(callbacks=[callback])
+
+    class FailingModule(dspy.Module):
+        def forward(self):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        FailingModule()()
+
+    assert fake.nodes[0].ended
+    assert fake.nodes[0].end_kwargs["level"] == "ERROR"
+    assert "boom" in fake.nodes[0].end_kwargs["status_message"]
+    assert not callback._calls
+
+
+def test_langfuse_callback_evicts_stale_records(monkeypatch):
+    monkeypatch.setattr("dspy.utils.langfuse_callback.MAX_IN_FLIGHT_CALLS", 3)
+
+    fake = FakeLangfuse()
+    callback = LangfuseCallback(langfuse=fake, background=False)
+
+    # Simulate start handlers whose matching end never fires.
+    for i in range(10):
+        callback.on_module_start(call_id=str(i), instance=object(), inputs={})
+
+    assert len(callback._calls) <= 3
+
+    _CURRENT_NODE.set(None)  # Clean up the dangling parent left by the orphaned starts.
+
+
+def test_langfuse_callback_background_flush():
+    fake = FakeLangfuse()
+    callback = LangfuseCallback(langfuse=fake, flush_batch_size=2)
+    dspy.settings.configure(lm=DummyLM([{"answer": "42"}] * 5), callbacks=[callback])
+
+    predict = dspy.Predict("question -> answer")
+    for _ in range(5):
+        predict(question="What is the meaning of life?")
+
+    # End handlers only enqueue; the background thread closes nodes and flushes.
+    callback.shutdown()
+    assert all(node.ended for node in fake.nodes)
+    assert fake.flush_count >= 1
+    assert not callback._calls
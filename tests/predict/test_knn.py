@@ -1,3 +1,5 @@
+import zlib
+
 import pytest
 import numpy as np
 import dspy
@@ -10,6 +12,55 @@ def mock_example(question: str, answer: str) -> dspy.Example:
     return dspy.Example(question=question, answer=answer).with_inputs("question")
 
 
+class DenseDummyVectorizer:
+    """Deterministically maps each text to a dense random vector.
+
+    Unlike DummyVectorizer's sparse n-gram counts, these vectors produce
+    well-separated similarity scores, which is what the int8 ordering test needs.
+    """
+
+    def __init__(self, dim=64):
+        self.dim = dim
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        vecs = []
+        for text in texts:
+            rng = np.random.default_rng(zlib.crc32(text.encode()))
+            vecs.append(rng.standard_normal(self.dim))
+        return np.array(vecs, dtype=np.float32)
+
+
+def test_knn_quantized_topk_matches_float32_ordering():
+    """The int8-quantized scoring path must rank neighbors like a float32 baseline."""
+    trainset = [mock_example(f"question number {i}", str(i)) for i in range(40)]
+    knn = KNN(k=5, trainset=trainset, vectorizer=dspy.Embedder(DenseDummyVectorizer()))
+
+    assert knn.trainset_vectors.dtype == np.int8
+
+    query = {"question": "question number 7"}
+    nearest = knn(**query)
+
+    # Recompute the ranking in float32 from the same embedder.
+    embedder = dspy.Embedder(DenseDummyVectorizer())
+    train_texts = [f"question: {example.question}" for example in trainset]
+    train_matrix = np.asarray(embedder(train_texts), dtype=np.float32)
+    query_vector = np.asarray(embedder(["question: question number 7"]), dtype=np.float32).reshape(-1)
+    expected_idxs = np.argsort(-(train_matrix @ query_vector))[:5]
+
+    assert [example.answer for example in nearest] == [trainset[i].answer for i in expected_idxs]
+
+
+def test_knn_k_larger_than_trainset():
+    """Requesting more neighbors than examples returns the whole trainset."""
+    trainset = [mock_example(f"question {i}", str(i)) for i in range(3)]
+    knn = KNN(k=10, trainset=trainset, vectorizer=dspy.Embedder(DummyVectorizer()))
+
+    nearest = knn(question="question 0")
+
+    assert len(nearest) == 3
+    assert {example.answer for example in nearest} == {"0", "1", "2"}
+
+
 # @pytest.fixture
 # def setup_knn():
 #     """Sets up a KNN instance with a mocked vectorizer for testing."""
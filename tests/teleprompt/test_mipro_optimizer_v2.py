@@ -0,0 +1,181 @@
+from collections import defaultdict
+
+import dspy
+from dspy import Example
+from dspy.teleprompt.mipro_optimizer_v2 import MIPROv2
+from dspy.utils.dummies import DummyLM
+
+
+# Define a simple metric function for testing
+def simple_metric(example, prediction):
+    # Simplified metric for testing: true if prediction matches expected output
+    return example.output == prediction.output
+
+
+class SimpleModule(dspy.Module):
+    def __init__(self, signature):
+        super().__init__()
+        self.predictor = dspy.Predict(signature)
+
+    def forward(self, **kwargs):
+        return self.predictor(**kwargs)
+
+
+class FakeTrial:
+    """Stands in for an Optuna trial; prunes after reports at the given steps."""
+
+    def __init__(self, prune_steps=()):
+        self.prune_steps = set(prune_steps)
+        self.reported = []
+
+    def report(self, value, step):
+        self.reported.append((value, step))
+
+    def should_prune(self):
+        return self.reported[-1][1] in self.prune_steps
+
+
+def make_optimizer():
+    optimizer = MIPROv2(metric=simple_metric, auto=None, num_threads=1)
+    optimizer._set_random_seeds(9)
+    return optimizer
+
+
+def make_batch(n):
+    return [Example(input=f"Question {i}", output="blue").with_inputs("input") for i in range(n)]
+
+
+def test_minibatch_eval_reports_running_mean_per_chunk(monkeypatch):
+    chunk_scores = iter([10.0, 20.0, 30.0, 40.0])
+    monkeypatch.setattr(
+        "dspy.teleprompt.mipro_optimizer_v2.eval_candidate_program",
+        lambda batch_size, batch, program, evaluate, rng: next(chunk_scores),
+    )
+    optimizer = make_optimizer()
+    trial = FakeTrial()
+
+    # 8 examples split into 4 chunks of 2; running means are 10, 15, 20, 25.
+    score, eval_calls, pruned = optimizer._eval_minibatch_with_pruning(
+        trial, SimpleModule("input -> output"), make_batch(8), evaluate=None
+    )
+
+    assert not pruned
+    assert score == 25.0
+    assert eval_calls == 8
+    assert trial.reported == [(10.0, 0), (15.0, 1), (20.0, 2), (25.0, 3)]
+
+
+def test_minibatch_eval_prunes_early(monkeypatch):
+    chunk_scores = iter([10.0, 20.0, 30.0, 40.0])
+    monkeypatch.setattr(
+        "dspy.teleprompt.mipro_optimizer_v2.eval_candidate_program",
+        lambda batch_size, batch, program, evaluate, rng: next(chunk_scores),
+    )
+    optimizer = make_optimizer()
+    trial = FakeTrial(prune_steps={1})
+
+    score, eval_calls, pruned = optimizer._eval_minibatch_with_pruning(
+        trial, SimpleModule("input -> output"), make_batch(8), evaluate=None
+    )
+
+    # Pruned after the second chunk: only 4 of 8 examples were evaluated.
+    assert pruned
+    assert score == 15.0
+    assert eval_calls == 4
+
+
+def test_minibatch_eval_probe_prune_has_no_score(monkeypatch):
+    monkeypatch.setattr(
+        "dspy.teleprompt.mipro_optimizer_v2.eval_candidate_program",
+        lambda batch_size, batch, program, evaluate, rng: 5.0,
+    )
+    optimizer = make_optimizer()
+    dspy.settings.configure(lm=DummyLM([{"output": "blue"}]))
+    trial = FakeTrial(prune_steps={0})
+
+    score, eval_calls, pruned = optimizer._eval_minibatch_with_pruning(
+        trial,
+        SimpleModule("input -> output"),
+        make_batch(8),
+        evaluate=None,
+        cheap_lm=DummyLM([{"output": "red"}]),
+    )
+
+    # A trial pruned on the cheap-LM probe has no task-model score to record.
+    assert pruned
+    assert score is None
+    assert eval_calls == 2
+
+
+def test_dedupe_instruction_candidates():
+    candidates = {
+        0: ["Original instruction.", "Answer the question.", "answer   the question.", "Be brief."],
+        1: ["Solve it.", "Solve it."],
+    }
+
+    deduped = MIPROv2._dedupe_instruction_candidates(candidates)
+
+    # Whitespace- and case-only variants collapse; index 0 keeps the original.
+    assert deduped[0] == ["Original instruction.", "Answer the question.", "Be brief."]
+    assert deduped[1] == ["Solve it."]
+
+
+def full_eval_setup(monkeypatch, measured_score=95.0):
+    monkeypatch.setattr(
+        "dspy.teleprompt.mipro_optimizer_v2.eval_candidate_program",
+        lambda batch_size, batch, program, evaluate, rng: measured_score,
+    )
+    optimizer = make_optimizer()
+    program = SimpleModule("input -> output")
+    valset = make_batch(4)
+    return optimizer, program, valset
+
+
+def test_full_eval_skipped_when_margin_is_decisive(monkeypatch):
+    optimizer, program, valset = full_eval_setup(monkeypatch)
+    param_score_dict = defaultdict(list, {"A": [(90.0, program)], "B": [(50.0, program)]})
+    trial_logs = {1: {}}
+    stats = {"ema": 1.0, "var": 4.0, "n": 3}
+
+    best_score, _, total_eval_calls = optimizer._perform_full_evaluation(
+        1, param_score_dict, {}, None, valset, trial_logs, 0, [], 0.0, program,
+        candidate_score_cache={}, full_eval_stats=stats, allow_skip=True,
+    )
+
+    assert trial_logs[1]["full_eval_skipped"]
+    assert trial_logs[1]["full_eval_score_estimate"] == 89.0  # mean minus EMA gap
+    assert best_score == 89.0
+    assert total_eval_calls == 0  # no LM calls spent
+
+
+def test_full_eval_measured_when_variance_is_degenerate(monkeypatch):
+    optimizer, program, valset = full_eval_setup(monkeypatch)
+    param_score_dict = defaultdict(list, {"A": [(90.0, program)], "B": [(50.0, program)]})
+    trial_logs = {1: {}}
+    stats = {"ema": 0.0, "var": 0.0, "n": 3}
+
+    best_score, _, total_eval_calls = optimizer._perform_full_evaluation(
+        1, param_score_dict, {}, None, valset, trial_logs, 0, [], 0.0, program,
+        candidate_score_cache={}, full_eval_stats=stats, allow_skip=True,
+    )
+
+    # Zero observed variance must not count as infinite confidence.
+    assert "full_eval_skipped" not in trial_logs[1]
+    assert best_score == 95.0
+    assert total_eval_calls == len(valset)
+    assert stats["n"] == 4  # the measured gap was folded into the EMA
+
+
+def test_full_eval_measured_when_leader_is_tied(monkeypatch):
+    optimizer, program, valset = full_eval_setup(monkeypatch)
+    param_score_dict = defaultdict(list, {"A": [(90.0, program)], "B": [(90.0, program)]})
+    trial_logs = {1: {}}
+    stats = {"ema": 1.0, "var": 4.0, "n": 3}
+
+    _, _, total_eval_calls = optimizer._perform_full_evaluation(
+        1, param_score_dict, {}, None, valset, trial_logs, 0, [], 0.0, program,
+        candidate_score_cache={}, full_eval_stats=stats, allow_skip=True,
+    )
+
+    assert "full_eval_skipped" not in trial_logs[1]
+    assert total_eval_calls == len(valset)